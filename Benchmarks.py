@@ -0,0 +1,90 @@
+"""
+Filename: Benchmarks.py
+Author: Alex Kolodinsky
+Created: 2026-10-19
+Description:
+    Timing for the pricing hot paths. Run: python Benchmarks.py
+    Compares NormalDistribution against scipy.stats.norm for the single-contract and the batch paths.
+    The single-contract production path is ContractLoader.price_contract (a 1-contract batch through the factory), the
+    per-contract reference classes are timed separately.
+"""
+
+import timeit
+from types import SimpleNamespace
+import numpy as np
+from scipy.stats import norm
+import NormalDistribution as nd
+import PricingModels as pf
+import PricingBackends as pb
+import ContractFactory as cf
+import DataFactory as df
+
+
+def scipy_norm():
+    """Swaps the NormalDistribution entry points for scipy.stats.norm - the implementation used before"""
+    return {"cdf_scalar": norm.cdf, "pdf_scalar": norm.pdf, "cdf": norm.cdf, "pdf": norm.pdf}
+
+
+def patched(functions, statement):
+    original = {name: getattr(nd, name) for name in functions}
+    for name, function in functions.items():
+        setattr(nd, name, function)
+    try:
+        return statement()
+    finally:
+        for name, function in original.items():
+            setattr(nd, name, function)
+
+
+def best_of(statement, number, repeat=5):
+    return min(timeit.repeat(statement, number=number, repeat=repeat)) / number
+
+
+def reference_contract():
+    """Per-contract reference classes (BlackScholesPricing + Greeks) - only used for parity checks now"""
+    contract = SimpleNamespace(S=100.0, K=105.0, T=0.1, r=0.03, sigma=0.3, q=0.0, dividend_pv=0.0, type="Call",
+                               pricing_model_name="Black Scholes Pricing")
+
+    def price_and_greeks():
+        pf.BlackScholesPricing(contract).compute_price()
+        pf.Greeks(contract).compute_greeks()
+
+    return best_of(price_and_greeks, number=2000)
+
+
+def single_contract():
+    """Production path for one contract - ContractLoader.price_contract routes a 1-contract batch through the factory"""
+    contract = cf.CallOption("AAPL250620C00105000", 100.0, 105.0, False, 0.1, 0.03, 0.3, "Call", 2.0)
+    pricing_factory = pf.PricingModelFactory("numpy")
+
+    return best_of(lambda: df.ContractLoader.price_contract(contract, pricing_factory), number=2000)
+
+
+def batch(contracts=100_000, seed=0):
+    rng = np.random.default_rng(seed)
+    S = rng.uniform(10, 500, contracts)
+    K = S * rng.uniform(0.7, 1.3, contracts)
+    T = rng.uniform(1 / 365, 1, contracts)
+    r = rng.uniform(0, 0.06, contracts)
+    sigma = rng.uniform(0.05, 1.5, contracts)
+    is_call = rng.random(contracts) < 0.5
+    backend = pb.get_backend("numpy")
+
+    return best_of(lambda: backend.black_scholes(S, K, T, r, sigma, is_call, greeks=True), number=5)
+
+
+def report(label, before, after, unit):
+    print(f"{label:<40} scipy.stats.norm {before * unit:10.2f}   NormalDistribution {after * unit:10.2f}   speedup {before / after:5.1f}x")
+
+
+if __name__ == "__main__":
+    x = 0.3
+    xs = np.random.default_rng(0).standard_normal(100_000)
+
+    report("cdf, scalar (us)", best_of(lambda: norm.cdf(x), 20000), best_of(lambda: nd.cdf_scalar(x), 20000), 1e6)
+    report("pdf, scalar (us)", best_of(lambda: norm.pdf(x), 20000), best_of(lambda: nd.pdf_scalar(x), 20000), 1e6)
+    report("cdf, 100k array (ms)", best_of(lambda: norm.cdf(xs), 20), best_of(lambda: nd.cdf(xs), 20), 1e3)
+    report("pdf, 100k array (ms)", best_of(lambda: norm.pdf(xs), 20), best_of(lambda: nd.pdf(xs), 20), 1e3)
+    report("single contract, price_contract (us)", patched(scipy_norm(), single_contract), single_contract(), 1e6)
+    report("single contract, reference classes (us)", patched(scipy_norm(), reference_contract), reference_contract(), 1e6)
+    report("batch 100k price + Greeks (ms)", patched(scipy_norm(), batch), batch(), 1e3)
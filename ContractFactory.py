@@ -15,7 +15,7 @@ import PricingModels as pf
 
 class BaseContract(ABC):
     """ Create Base Contract Class"""                     
-    def __init__(self, name, underlying_price, strike_price, itm, ttm, risk_free_rate, volatility, contract_type, ask):
+    def __init__(self, name, underlying_price, strike_price, itm, ttm, risk_free_rate, volatility, contract_type, ask, exercise_style="American", path_payoff=None):
         self.name = name
         self.S = underlying_price
         self.K = strike_price
@@ -25,8 +25,14 @@ class BaseContract(ABC):
         self.sigma = volatility
         self.type = contract_type
         self.ask = ask
+        self.exercise_style = exercise_style   # Listed equity options are American
+        self.path_payoff = path_payoff         # payoff(paths, K, is_call), e.g. MonteCarloPricing.arithmetic_asian - None = vanilla
+        self.path_dependent = path_payoff is not None                   # Routes to Monte Carlo
 
         # Calculated later  - initialization
+        self.q = 0.0                           # Continuous dividend yield + borrow cost
+        self.dividend_pv = 0.0                 # Present value of the cash dividends paid before expiry
+        self.dividend_row = None               # Row of the ticker in the DividendSchedule arrays
         self.fair_value = None
         self.price_difference = None
         self.price_difference_percent = None
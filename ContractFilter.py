@@ -0,0 +1,115 @@
+"""
+Filename: ContractFilter.py
+Author: Alex Kolodinsky
+Created: 2026-10-19
+Description:
+    One configurable liquidity / data-quality filter stage, run on the raw option chain before anything is priced.
+"""
+
+import numpy as np
+
+
+class ContractFilter:
+    """ Declarative filter - every rule is a vectorized mask over the chain, and the rows each rule removed are reported """
+
+    defaults = {
+        "min_volume": 5,                                            # Strictly greater than (None disables)
+        "min_open_interest": 5,
+        "max_relative_spread": None,                                # (ask - bid) / mid, e.g. 0.5
+        "moneyness": None,                                          # (low, high) band on S / K, e.g. (0.8, 1.2)
+        "ttm": (0, None),                                           # (low, high) in years, exclusive - 0 drops expired contracts
+        "implied_volatility": (0.01, 5.0),                          # Outside this the quote is almost always bad data
+        "drop_below_intrinsic": True,                               # ask < intrinsic value - stale / crossed quote
+        "drop_above_upper_bound": True,                             # ask >= S (call) or K (put) - no model can call it undervalued
+    }
+
+    def __init__(self, **config):
+        unknown = set(config) - set(self.defaults)
+        if unknown:
+            raise ValueError(f"Invalid filter setting(s): {sorted(unknown)}")
+        self.config = {**self.defaults, **config}
+        self.report = {}                                            # Rule name -> rows removed in the last apply()
+
+    @staticmethod
+    def within(values, bounds):
+        low, high = bounds
+        mask = np.ones(len(values), dtype=bool)
+        if low is not None:
+            mask &= np.asarray(values > low)
+        if high is not None:
+            mask &= np.asarray(values < high)
+        return mask
+
+    def rules(self):
+        """ (name, mask function) pairs in the order they are applied. Disabled settings are skipped """
+        config = self.config
+        rules = [
+            ("missing data", lambda chain: chain[["bid", "ask", "volume", "openInterest"]].notna().all(axis=1)),
+            ("zero / crossed quote", lambda chain: (chain["bid"] > 0) & (chain["ask"] > 0) & (chain["ask"] >= chain["bid"])),
+        ]
+
+        if config["min_volume"] is not None:
+            rules.append(("volume", lambda chain: chain["volume"] > config["min_volume"]))
+        if config["min_open_interest"] is not None:
+            rules.append(("open interest", lambda chain: chain["openInterest"] > config["min_open_interest"]))
+        if config["max_relative_spread"] is not None:
+            rules.append(("spread", lambda chain: (chain["ask"] - chain["bid"]) / ((chain["ask"] + chain["bid"]) / 2) <= config["max_relative_spread"]))
+        if config["ttm"] is not None:
+            rules.append(("time to maturity", lambda chain: self.within(chain["ttm"], config["ttm"])))
+        if config["implied_volatility"] is not None:
+            rules.append(("implied volatility", lambda chain: self.within(chain["impliedVolatility"], config["implied_volatility"])))
+        if config["moneyness"] is not None:
+            rules.append(("moneyness", lambda chain: self.within(chain["Underlying_Price"] / chain["strike"], config["moneyness"])))
+
+        # Cheap no-arbitrage bounds - prune before any model runs
+        if config["drop_below_intrinsic"]:
+            rules.append(("ask below intrinsic", lambda chain: chain["ask"] >= self.intrinsic_value(*self.chain_arrays(chain))))
+        if config["drop_above_upper_bound"]:
+            rules.append(("ask above upper bound", lambda chain: chain["ask"] < self.upper_bound(*self.chain_arrays(chain))))
+        return rules
+
+    def valid_quotes(self, ask, sigma, S, K, is_call):
+        """ The quote-level rules (positive ask, implied volatility, no-arbitrage bounds) on plain arrays - for contracts that
+        already passed ingestion and then got a new quote or underlying price. There is no bid in a tick, so no crossed check """
+        config = self.config
+        ask, sigma, S, K = (np.asarray(values, dtype=float) for values in (ask, sigma, S, K))
+        is_call = np.asarray(is_call, dtype=bool)
+
+        valid = ask > 0                                             # NaN compares False too
+        if config["implied_volatility"] is not None:
+            valid &= self.within(sigma, config["implied_volatility"])
+        if config["drop_below_intrinsic"]:
+            valid &= ask >= self.intrinsic_value(S, K, is_call)
+        if config["drop_above_upper_bound"]:
+            valid &= ask < self.upper_bound(S, K, is_call)
+        return valid
+
+    @staticmethod
+    def chain_arrays(chain):
+        """ (S, K, is_call) arrays of a chain, in the order the bound functions take them """
+        return chain["Underlying_Price"].to_numpy(), chain["strike"].to_numpy(), (chain["Type"] == "Call").to_numpy()
+
+    @staticmethod
+    def intrinsic_value(S, K, is_call):
+        return np.maximum(np.where(is_call, S - K, K - S), 0)
+
+    @staticmethod
+    def upper_bound(S, K, is_call):
+        """ A call is never worth more than the stock, a put never more than the strike """
+        return np.where(is_call, S, K)
+
+    def apply(self, chain, label="Chain"):
+        """ Returns the rows that pass every rule. Each rule is only charged for rows no earlier rule already removed """
+        keep = np.ones(len(chain), dtype=bool)
+        self.report = {}
+
+        for name, rule in self.rules():
+            mask = np.asarray(rule(chain), dtype=bool)              # NaN comparisons are False, so bad rows fail every rule
+            self.report[name] = int((keep & ~mask).sum())
+            keep &= mask
+
+        print(f"{label}: {len(chain)} rows before filtering, {int(keep.sum())} after")
+        for name, removed in self.report.items():
+            if removed:
+                print(f"    {name}: removed {removed}")
+        return chain[keep]
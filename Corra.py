@@ -64,5 +64,6 @@ def get_latest_rates():
         "1y": t_bill_rates.get("1y", None)
     }
 
-rates = get_latest_rates()
-print("Final fetched rates:", rates)  # Debug statement
\ No newline at end of file
+if __name__ == "__main__":                  # Importing must not hit the network - callers fetch when they need rates
+    rates = get_latest_rates()
+    print("Final fetched rates:", rates)  # Debug statement
\ No newline at end of file
@@ -6,11 +6,13 @@ Description:
     Try to implement factory method.
 """
 
+import re
 import numpy as np
 import pandas as pd
 import PricingModels as pf
 import ContractFactory as cf
 from Corra import get_latest_rates
+from Dividends import DividendSchedule
 
 class ContractLoader:
     """ Handles loading contracts from CSV file data and ContractFactory Parameters """
@@ -19,8 +21,15 @@ class ContractLoader:
     csv_file = "contract_data.csv"
 
     @staticmethod                                         # The csv portion should be static
-    def load_contract(filename=None):
-        
+    def load_contract(filename=None, backend="numpy"):
+        contracts = ContractLoader.build_contracts(filename, backend=backend)
+        return [contract for contract in contracts if contract.price_difference > 0]     # Only return contracts that are undervalued
+
+    @staticmethod
+    def build_contracts(filename=None, rates=None, backend="numpy", contract_filter=None, dividends=None, pricing_factory=None):
+        """ Builds and prices every contract in the csv - the streaming mode needs all of them, not only the undervalued ones.
+        Pass pricing_factory to keep using it afterwards (its cost estimates carry over), otherwise one is made for backend """
+
         if filename is None:
             filename = ContractLoader.csv_file            # Allows for a default csv file.
         
@@ -28,25 +37,80 @@ class ContractLoader:
         df = pd.read_csv(filename)                        # Reads CSV file
         contract_data = []
         
-        df.dropna(subset=["Type", "ask"], inplace=True)   # Filter again - redundant
         df["Type"] = df["Type"].astype(str).str.strip()
-        df = df[df["ask"] != 0]
+        if contract_filter is not None:                   # The csv from Data_Processing is already filtered - only needed for other sources
+            df = contract_filter.apply(df, label=filename)
 
               
-        rates = get_latest_rates()                        # Fetch risk free rates before loop
-        pricing_factory = pf.PricingModelFactory()        # Initializing PricingModelFactory
+        if rates is None:
+            rates = get_latest_rates()                    # Fetch risk free rates before loop
+        if pricing_factory is None:
+            pricing_factory = pf.PricingModelFactory(backend)   # Initializing PricingModelFactory with the selected compute backend
 
         for _, row in df.iterrows():
-            contract = ContractLoader.assign_contract_type(row, rates)
-            ContractLoader.apply_correct_pricing(contract, pricing_factory)               
-            ContractLoader.apply_price_difference(contract)
-            ContractLoader.calculate_greeks(contract)
-            
-            if contract.price_difference > 0:                                   # Only append contracts that are undervalued  
-                contract_data.append(contract)
+            contract_data.append(ContractLoader.assign_contract_type(row, rates))
 
+        if dividends is None:
+            dividends = DividendSchedule.from_csv()               # Per-ticker dividend schedules written by Data_Processing.py
+        ContractLoader.apply_dividends(contract_data, dividends)
+        ContractLoader.price_contracts(contract_data, pricing_factory, dividends)
         return contract_data
 
+    @staticmethod
+    def price_contracts(contracts, pricing_factory, dividends=None):
+        """ Prices a list of contracts - the factory routes each contract group to its engine as one vectorized batch.
+        dividends is the DividendSchedule passed to apply_dividends - without it the lattice only sees the dividend PV """
+        if not contracts:
+            return
+
+        schedules = {}
+        if dividends is not None:                                   # Whole rows of the padded arrays, one fancy index - the lattice needs the dates
+            rows = np.array([contract.dividend_row for contract in contracts])
+            schedules = {"dividend_times": dividends.times[rows], "dividend_amounts": dividends.amounts[rows]}
+
+        ask = np.array([contract.ask for contract in contracts], dtype=float)
+        result = pricing_factory.price_batch(
+            [contract.S for contract in contracts],
+            [contract.K for contract in contracts],
+            [contract.T for contract in contracts],
+            [contract.r for contract in contracts],
+            [contract.sigma for contract in contracts],
+            [contract.type == "Call" for contract in contracts],
+            american=[contract.exercise_style == "American" for contract in contracts],
+            payoffs=[contract.path_payoff for contract in contracts],
+            q=[contract.q for contract in contracts],
+            dividend_pv=[contract.dividend_pv for contract in contracts],
+            **schedules,
+        )
+        result["price_difference"] = result["price"] - ask
+        result["price_difference_percent"] = ((result["price"] / ask) - 1) * 100
+        result["fair_value"] = result.pop("price")
+
+        columns = {name: values.tolist() for name, values in result.items()}             # Python floats, same as the per-contract path
+        for i, contract in enumerate(contracts):
+            for name, values in columns.items():
+                setattr(contract, name, values[i])
+
+    @staticmethod
+    def apply_dividends(contracts, dividends):
+        """ Broadcasts the per-ticker schedules to every contract in one vectorized lookup """
+        if not contracts:
+            return
+
+        tickers = [ContractLoader.get_ticker(contract.name) for contract in contracts]
+        rows = dividends.lookup(tickers)
+        carry = dividends.carry(tickers).tolist()
+        dividend_pv = dividends.present_value(tickers, [contract.T for contract in contracts], [contract.r for contract in contracts]).tolist()
+        for contract, q, pv, row in zip(contracts, carry, dividend_pv, rows.tolist()):
+            contract.q = q
+            contract.dividend_pv = pv
+            contract.dividend_row = row                             # price_contracts indexes the schedule's padded arrays with it
+
+    @staticmethod
+    def price_contract(contract, pricing_factory, dividends=None):
+        """ Runs the full pricing pipeline on a single contract """
+        ContractLoader.price_contracts([contract], pricing_factory, dividends)
+
     @staticmethod
     def assign_contract_type(row, rates):                          
         name = row["contractSymbol"] 
@@ -58,46 +122,16 @@ class ContractLoader:
         volatility = row["impliedVolatility"] 
         contract_type = row["Type"]
         ask = row["ask"]        
+        exercise_style = row.get("exerciseStyle", "American")      # Not in the yfinance data - US equity options are American
 
         if contract_type == "Call":
-            return cf.CallOption(name, underlying_price, strike_price, itm, ttm, risk_free_rate, volatility, contract_type, ask)
+            return cf.CallOption(name, underlying_price, strike_price, itm, ttm, risk_free_rate, volatility, contract_type, ask, exercise_style)
         elif contract_type == "Put":
-            return cf.PutOption(name, underlying_price, strike_price, itm, ttm, risk_free_rate, volatility, contract_type, ask)
+            return cf.PutOption(name, underlying_price, strike_price, itm, ttm, risk_free_rate, volatility, contract_type, ask, exercise_style)
 
         else:
             raise ValueError(f"Invalid contract type: {contract_type}")
 
-    @staticmethod
-    def apply_correct_pricing(contract, pricing_model):
-        pricing_model = pricing_model.select_pricing_model(contract)
-        
-        if pricing_model:
-            contract.fair_value = pricing_model.compute_price()
-            contract.pricing_model_name = pricing_model.get_pricing_model_name()
-
-    @staticmethod
-    def apply_price_difference(contract):
-        # Create and apply TradingEdge logic
-        price_difference = pf.PriceDifference(contract)
-        price_difference.compute_price_difference()
-        price_difference.compute_price_difference_percent()
-
-        # Store the calculated values back into the BaseContract instance
-        contract.price_difference = price_difference.price_difference
-        contract.price_difference_percent = price_difference.price_difference_percent
-
-    @staticmethod
-    def calculate_greeks(contract):
-        if contract.fair_value is not None:
-            greeks = pf.Greeks(contract)
-            greeks.compute_greeks()
-            
-        contract.delta = greeks.delta
-        contract.gamma = greeks.gamma
-        contract.vega = greeks.vega
-        contract.theta = greeks.theta
-        contract.rho = greeks.rho
-
     @staticmethod
     def get_risk_free_rate(ttm, rates):
         if ttm <= 1/12:
@@ -108,3 +142,33 @@ class ContractLoader:
             return rates.get("6m", rates["CORRA"])
         else:
             return rates.get("1y", rates["CORRA"])
+
+    @staticmethod
+    def get_ticker(name):
+        company_name = re.match(r'^([A-Za-z]+)', name)                 # Contract symbols start with the underlying ticker
+        return company_name.group(1) if company_name else ""
+
+    @staticmethod
+    def to_record(contract):
+        """ Flattens a contract into the row layout used by the output csv and the dashboard """
+        return {
+            "Company": ContractLoader.get_ticker(contract.name),
+            "Name": contract.name,
+            "Type": contract.type,
+            "Price Difference Percent": round(contract.price_difference_percent, 2),
+            "Underlying_Price": contract.S,
+            "Strike": contract.K,
+            "In The Money": contract.itm,
+            "Algorithm Used": contract.pricing_model_name,
+            "Calculated_Price": round(contract.fair_value, 4),
+            "Ask": round(contract.ask, 4),
+            "Price Difference": round(contract.price_difference, 4),
+            "TTM": round(contract.T, 6),
+            "RFR": contract.r,
+            "Volatility": round(contract.sigma, 4),
+            "Delta": round(contract.delta, 4),
+            "Gamma": round(contract.gamma, 4),
+            "Vega": round(contract.vega, 4),
+            "Theta": round(contract.theta, 4),
+            "Rho": round(contract.rho, 4),
+        }
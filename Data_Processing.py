@@ -12,11 +12,16 @@ import numpy as np
 import pandas as pd
 import yfinance as yf
 import matplotlib.pyplot as plt
+from ContractFilter import ContractFilter
+from Dividends import DividendSchedule
 
 
 tickers = ["AAPL", "NVDA", "MSFT", "GOOG", "TSLA", "V", "JPM", "AMZN", "AVGO", "PLTR", "SPY"]                                  # This can be fed in by the user in the future
 
-def compile_options_data(ticker_symbol):                                            # Compiles put and call options data for a singular ticker
+def compile_options_data(ticker_symbol, contract_filter=None):                      # Compiles put and call options data for a singular ticker
+    if contract_filter is None:
+        contract_filter = ContractFilter()                                          # Default liquidity / data-quality settings
+
     ticker = yf.Ticker(ticker_symbol)
     options_dates = ticker.options
     
@@ -75,43 +80,35 @@ def compile_options_data(ticker_symbol):
         ttm = ttm_years
     )    
     
-    # Dropping contracts with missing data / seemingly low liquidity
-    calls = calls.dropna(subset=["bid", "ask", "volume", "openInterest"])
-    puts = puts.dropna(subset=["bid", "ask", "volume", "openInterest"])
-
-
-    # Filtering contracts 
-    calls = calls[(calls["bid"] != 0) & (calls["ask"] != 0) & (calls["ttm"] != 0)]                        # Removing 0 values from calls and puts
-    puts = puts[(puts["bid"] != 0) & (puts["ask"] != 0) & (puts["ttm"] != 0)]
-
-    # Further filtering for illiquid contracts
-    filtered_calls = calls[(calls["volume"] > 5) & (calls["openInterest"] > 5)]
-    filtered_puts = puts[(puts["volume"] > 5) & (puts["openInterest"] > 5)]
+    # Liquidity / data-quality filtering (see ContractFilter.py for the rules and their settings)
+    return contract_filter.apply(pd.concat([calls, puts]), label=f"Ticker {ticker_symbol}")                # Concatinating calls and puts data using pandas 
 
-    print(f"Ticker {ticker_symbol}: calls before filtering: {len(calls)}, after filtering: {len(filtered_calls)}")
-    print(f"Ticker {ticker_symbol}: puts before filtering: {len(puts)}, after filtering: {len(filtered_puts)}")
-
-    return pd.concat([filtered_calls, filtered_puts])                                                 # Concatinating calls and puts data using pandas 
-
-def combine_options_data(tickers):                                                  # Combining data from compile_options_data function and list "tickers"
+def combine_options_data(tickers, contract_filter=None):                            # Combining data from compile_options_data function and list "tickers"
     options_data_list = []
     for ticker in tickers:
         print(f"Fetching data for {ticker}")                                        # Debug statement
-        data = compile_options_data(ticker)
+        data = compile_options_data(ticker, contract_filter)
         if data is not None:
             print(f"Data found for {ticker}")                                       # Debug
             options_data_list.append(data)
 
     return pd.concat(options_data_list, ignore_index=True) if options_data_list else None       #Checks to see if the options data list is emptly before returning, done to prevent crashes (found)
 
-def create_csv(tickers, filename="contract_data.csv"):                                 # Saves options data into a single csv
-    contract_data = combine_options_data(tickers)
+def create_csv(tickers, filename="contract_data.csv", contract_filter=None):          # Saves options data into a single csv
+    contract_data = combine_options_data(tickers, contract_filter)
     if contract_data is not None:
         contract_data.to_csv(filename, index=False)
         print(f"Options data successfully saved to {filename}")
     else:
         print("No options data found")
 
+def create_dividend_csv(tickers, filename=DividendSchedule.csv_file):                 # Saves projected cash dividends for the next year
+    schedules = [DividendSchedule.project(ticker, yf.Ticker(ticker).dividends) for ticker in tickers]
+    dividend_data = pd.concat(schedules, ignore_index=True)
+    dividend_data.to_csv(filename, index=False)
+    print(f"Dividend schedules for {dividend_data['Ticker'].nunique()} tickers saved to {filename}")
+
 create_csv(tickers)
+create_dividend_csv(tickers)
 
 """------------------------------------------------------------------------------------------------------------------------------------------------------"""
\ No newline at end of file
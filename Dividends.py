@@ -0,0 +1,88 @@
+"""
+Filename: Dividends.py
+Author: Alex Kolodinsky
+Created: 2026-10-19
+Description:
+    Per-ticker dividend schedules (continuous yields, borrow costs and discrete cash dividends), broadcast to whole chains at once.
+"""
+
+import os
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+
+class DividendSchedule:
+    """ Stores dividends per ticker as padded (tickers x dividends) arrays, so a chain is adjusted by indexing instead of looping """
+
+    csv_file = "dividend_data.csv"                                  # Ticker, exDate, amount - written by Data_Processing.py
+
+    def __init__(self, cash=None, yields=None, borrow=None, today=None):
+        self.cash = cash if cash is not None else pd.DataFrame(columns=["Ticker", "exDate", "amount"])
+        self.yields = yields or {}                                  # Ticker -> continuous dividend yield (indices / funds without a cash schedule)
+        self.borrow = borrow or {}                                  # Ticker -> stock borrow fee, priced like an extra yield
+        self.today = today if today is not None else datetime.today()
+        self.build_arrays()
+
+    def build_arrays(self):
+        cash = self.cash.copy()
+        cash["ttx"] = (pd.to_datetime(cash["exDate"]) - pd.Timestamp(self.today)).dt.days / 365     # Years to ex-date, same day count as ttm
+        cash = cash[cash["ttx"] > 0].sort_values(["Ticker", "ttx"])
+
+        self.tickers = sorted(set(cash["Ticker"]) | set(self.yields) | set(self.borrow))
+        self.index = {ticker: i for i, ticker in enumerate(self.tickers)}
+        rows = cash["Ticker"].map(self.index).to_numpy(dtype=int)
+        columns = cash.groupby("Ticker").cumcount().to_numpy(dtype=int)
+        width = columns.max() + 1 if len(cash) else 1
+
+        # One extra row at the end for tickers with no dividends - it never pays anything
+        self.times = np.full((len(self.tickers) + 1, width), np.inf)
+        self.amounts = np.zeros((len(self.tickers) + 1, width))
+        self.times[rows, columns] = cash["ttx"].to_numpy(dtype=float)
+        self.amounts[rows, columns] = cash["amount"].to_numpy(dtype=float)
+
+        self.carry_rates = np.zeros(len(self.tickers) + 1)
+        for ticker, rate in self.yields.items():
+            self.carry_rates[self.index[ticker]] += rate
+        for ticker, rate in self.borrow.items():
+            self.carry_rates[self.index[ticker]] += rate
+
+    @classmethod
+    def from_csv(cls, filename=None, **kwargs):
+        if filename is None:
+            filename = cls.csv_file
+        if not os.path.exists(filename):
+            print(f"No dividend data found at {filename} - pricing without dividends")
+            return cls(**kwargs)
+        return cls(pd.read_csv(filename), **kwargs)
+
+    def lookup(self, tickers):
+        """ Row of every contract's ticker in the padded arrays """
+        return pd.Series(tickers).map(self.index).fillna(len(self.tickers)).to_numpy(dtype=int)
+
+    def carry(self, tickers):
+        """ Continuous dividend yield + borrow cost per contract """
+        return self.carry_rates[self.lookup(tickers)]
+
+    def present_value(self, tickers, T, r):
+        """ PV of the cash dividends with an ex-date before each contract's expiry """
+        rows = self.lookup(tickers)
+        T, r = np.asarray(T, dtype=float)[:, None], np.asarray(r, dtype=float)[:, None]
+        times = self.times[rows]
+        paid = times < T
+        return (self.amounts[rows] * np.exp(-r * np.where(paid, times, 0)) * paid).sum(axis=1)
+
+    @staticmethod
+    def project(ticker_symbol, history, horizon_years=1, today=None):
+        """ Projects the next cash dividends from the payment history - last amount, repeated at the usual spacing """
+        today = pd.Timestamp(today if today is not None else datetime.today())
+        if len(history) < 2:
+            return pd.DataFrame(columns=["Ticker", "exDate", "amount"])
+
+        history = history.copy()
+        history.index = pd.to_datetime(history.index).tz_localize(None)
+        spacing = pd.Series(history.index[-5:]).diff().median()     # Quarterly / monthly payers
+        ex_dates = pd.date_range(history.index[-1] + spacing, today + pd.DateOffset(years=horizon_years), freq=spacing)
+
+        ex_dates = ex_dates[ex_dates > today]
+        return pd.DataFrame({"Ticker": ticker_symbol, "exDate": ex_dates.strftime("%Y-%m-%d"), "amount": history.iloc[-1]})
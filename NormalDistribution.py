@@ -0,0 +1,35 @@
+"""
+Filename: NormalDistribution.py
+Author: Alex Kolodinsky
+Created: 2026-10-19
+Description:
+    Standard normal CDF/PDF for the pricing hot paths, without the scipy.stats.norm distribution machinery.
+    Scalar entry points use math.erfc (no array allocation), array entry points use scipy.special.ndtr.
+    Both agree with scipy.stats.norm to ~1e-16 and keep float32 inputs in float32.
+"""
+
+import math
+import numpy as np
+from scipy.special import ndtr
+
+INV_SQRT_2PI = 0.3989422804014327                                   # 1 / sqrt(2 pi)
+INV_SQRT_2 = 0.7071067811865476                                     # 1 / sqrt(2)
+
+
+def cdf_scalar(x):
+    """N(x) for a single float - erfc keeps the left tail accurate (1 - N(-x) would cancel)"""
+    return 0.5 * math.erfc(-x * INV_SQRT_2)
+
+
+def pdf_scalar(x):
+    return INV_SQRT_2PI * math.exp(-0.5 * x * x)
+
+
+def cdf(x):
+    """N(x) for arrays"""
+    return ndtr(x)
+
+
+def pdf(x):
+    x = np.asarray(x)
+    return INV_SQRT_2PI * np.exp(-0.5 * x * x)
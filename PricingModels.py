@@ -6,37 +6,154 @@ Description:
     Try to implement factory method.
 """
 
+import math
 import numpy as np
-from scipy.stats import norm
+import NormalDistribution as nd
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+import PricingBackends as pb
 
     
 
+class RoutingPolicy:
+    """Decides which engines are accurate for which contracts - one vectorized mask per contract group"""
+
+    def __init__(self, deep_otm=0.15, min_early_exercise_ttm=2 / 365, latency_budget=None):
+        self.deep_otm = deep_otm                                    # Further out of the money than ln(K/S) (calls) or ln(S/K) (puts) - early exercise premium is negligible
+        self.min_early_exercise_ttm = min_early_exercise_ttm        # Shorter than this the early exercise premium is negligible too
+        self.latency_budget = latency_budget                        # Seconds per group, None = no limit
+
+    def groups(self, S, K, T, is_call, american, path_dependent, pays_dividends):
+        """(group name, mask, accurate engines, fallback engine if every accurate one is over the latency budget)"""
+        out_of_the_money = np.where(is_call, np.log(K / S), np.log(S / K))
+        early_exercise = (american & ~path_dependent
+                          & (~is_call | pays_dividends)               # An American call on a non-dividend stock is never exercised early
+                          & (out_of_the_money < self.deep_otm)
+                          & (T >= self.min_early_exercise_ttm))
+        # Only engines that are correct for the group are candidates - the lattice always applies early exercise and
+        # Monte Carlo is noisy with no Greeks, so neither is ever picked for contracts Black Scholes prices exactly.
+        # Closed form has two exact engines with different overhead / per contract costs, the cost model picks between them;
+        # early exercise and path dependent contracts have one accurate engine each, so those are rule based (+ budget fallback)
+        return [
+            ("closed form", ~path_dependent & ~early_exercise, ["bs", "bs_scalar"], None),
+            ("early exercise", early_exercise, ["lattice"], "bs"),
+            ("path dependent", path_dependent, ["mc"], None),
+        ]
+
+
 class PricingModelFactory:
     """Logic for selecting price algorithm - allows for future expansion"""
 
-    def __init__(self):
+    greek_names = ["delta", "gamma", "vega", "theta", "rho"]
+    cost_smoothing = 0.2                                            # Weight of the latest measurement in the cost estimates
+    small_batch = 10                                                # Batches up to this size are mostly call overhead - they refine the overhead estimate
+
+    def __init__(self, backend="numpy", policy=None):
         self.bs = BlackScholesPricing
+        self.bs_scalar = ScalarBlackScholesPricing
         self.mc = MonteCarloPricing
-        
-    def select_pricing_model(self,contract):
-        # print("bs class:", self.bs)                                # Checking bs class - debugging
-        if contract.T < (365 / 365):                                 # I just set a standard rule to ensure BlackScholesPricing is always chosen for now. T seems to be stored as a string
-            return self.bs(contract)
+        self.lattice = BinomialPricing
+        self.engines = {"bs": self.bs, "bs_scalar": self.bs_scalar, "lattice": self.lattice, "mc": self.mc}
+        self.backend = pb.get_backend(backend)                       # Compute backend for the batch path - numpy, float32, numexpr or numba
+        self.policy = policy if policy is not None else RoutingPolicy()
+
+        # Estimated cost = overhead per call + seconds per contract, refined with every batch that runs
+        self.costs = {name: {"overhead": engine.estimated_overhead, "per_contract": engine.estimated_cost} for name, engine in self.engines.items()}
+        self.cost_log = deque(maxlen=1000)                          # Estimated vs actual cost of the latest batches
+
+    def route(self, S, K, T, is_call, american, path_dependent, pays_dividends):
+        """Yields (group name, mask, engine name) for every non-empty contract group"""
+        for group, mask, candidates, fallback in self.policy.groups(S, K, T, is_call, american, path_dependent, pays_dividends):
+            if mask.any():
+                yield group, mask, self.choose_engine(candidates, fallback, int(mask.sum()))
+
+    def choose_engine(self, candidates, fallback, contracts):
+        """Cheapest accurate engine by estimated cost - the fallback is used if even that one misses the latency budget"""
+        name = min(candidates, key=lambda engine: self.estimate_cost(engine, contracts))
+        budget = self.policy.latency_budget
+        if budget is not None and fallback is not None and self.estimate_cost(name, contracts) > budget:
+            return fallback
+        return name
+
+    def estimate_cost(self, engine, contracts):
+        cost = self.costs[engine]
+        return cost["overhead"] + cost["per_contract"] * contracts
+
+    def record_cost(self, engine, group, contracts, seconds):
+        self.cost_log.append({"engine": engine, "group": group, "contracts": contracts,
+                              "estimated": self.estimate_cost(engine, contracts), "actual": seconds})
+        cost = self.costs[engine]
+        if contracts <= self.small_batch:
+            measured = seconds - cost["per_contract"] * contracts
+            cost["overhead"] = max(0.0, cost["overhead"] + self.cost_smoothing * (measured - cost["overhead"]))
         else:
-            return self.mc(contract)
+            measured = (seconds - cost["overhead"]) / contracts
+            cost["per_contract"] = max(0.0, cost["per_contract"] + self.cost_smoothing * (measured - cost["per_contract"]))
+
+    def price_batch(self, S, K, T, r, sigma, is_call, american=None, payoffs=None, q=None, dividend_pv=None,
+                    dividend_times=None, dividend_amounts=None):
+        """Routes, prices and computes the Greeks of a batch of contracts - every contract group goes to its engine as one batch.
+        payoffs holds each contract's path payoff (see MonteCarloPricing), None for vanilla - contracts with one are path dependent.
+        q is the continuous carry (dividend yield + borrow), dividend_pv the present value of the cash dividends paid before expiry.
+        dividend_times / dividend_amounts are the (contracts x dividends) cash schedules, padded with inf / 0 - engines that
+        exercise early need them to add back the dividends still to be paid"""
+        S, K, T, r, sigma = (np.asarray(values, dtype=float) for values in (S, K, T, r, sigma))
+        is_call = np.asarray(is_call, dtype=bool)
+        american = np.ones(T.shape, dtype=bool) if american is None else np.asarray(american, dtype=bool)                 # Listed equity options are American
+        payoffs, given = np.full(T.shape, None, dtype=object), payoffs
+        if given is not None:
+            payoffs[:] = list(given)
+        path_dependent = np.array([payoff is not None for payoff in payoffs], dtype=bool)
+        q = np.zeros(T.shape) if q is None else np.asarray(q, dtype=float)
+        dividend_pv = np.zeros(T.shape) if dividend_pv is None else np.asarray(dividend_pv, dtype=float)
+        S = S - dividend_pv                                         # Escrowed dividend model - every engine prices the stock net of its cash dividends
+        if dividend_times is not None:
+            dividend_times, dividend_amounts = np.asarray(dividend_times, dtype=float), np.asarray(dividend_amounts, dtype=float)
+
+        result = {name: np.full(T.shape, np.nan) for name in ["price"] + self.greek_names}
+        result["pricing_model_name"] = np.full(T.shape, None, dtype=object)
+
+        for group, mask, engine in self.route(S, K, T, is_call, american, path_dependent, (q > 0) | (dividend_pv > 0)):
+            model = self.engines[engine]
+            batches = [mask]
+            if model.uses_payoff:                                   # One simulation per distinct payoff in the group
+                batches = [mask & np.array([other is payoff for other in payoffs]) for payoff in dict.fromkeys(payoffs[mask])]
+
+            for batch in batches:
+                extra = {}
+                if model.uses_payoff:
+                    extra["payoff"] = payoffs[batch][0]
+                if model.uses_dividend_schedule and dividend_times is not None:
+                    extra.update(dividend_times=dividend_times[batch], dividend_amounts=dividend_amounts[batch])
+                start = time.perf_counter()
+                priced = model.price_batch(S[batch], K[batch], T[batch], r[batch], sigma[batch], is_call[batch], self.backend,
+                                           q=q[batch], **extra)
+                self.record_cost(engine, group, int(batch.sum()), time.perf_counter() - start)
+
+                for name, values in priced.items():
+                    result[name][batch] = values
+            result["pricing_model_name"][mask] = model.model_name
+        return result
 
 
 
 class PricingModel(ABC):
     """Initialize an abstract class for pricing algorithms"""
 
+    model_name = None
+    estimated_overhead = None                                       # Seconds per call before anything has been measured
+    estimated_cost = None                                           # Seconds per contract before anything has been measured
+    uses_dividend_schedule = False                                  # True for engines that need the cash dividend dates, not only their PV
+    uses_payoff = False                                             # True for engines that price the contract's own path payoff
+
     def __init__(self, contract):
         self.contract = contract                                    # Initializing to not have to keep writing "self.contract"
-        self.S = contract.S                                         # Code is more readable
+        self.S = contract.S - contract.dividend_pv                  # Stock net of the cash dividends paid before expiry (escrowed dividend model)
         self.K = contract.K
         self.T = contract.T
         self.r = contract.r
+        self.q = contract.q                                         # Continuous dividend yield + borrow cost
         self.sigma = contract.sigma
         self.type = contract.type
 
@@ -44,77 +161,206 @@ class PricingModel(ABC):
     def compute_price(self):
         pass
 
+    @staticmethod
     @abstractmethod
-    def get_pricing_model_name(self):
+    def price_batch(S, K, T, r, sigma, is_call, backend, q=0.0):
+        """Prices arrays of contracts, returns a dict with "price" and whichever Greeks the model provides"""
         pass
 
+    def get_pricing_model_name(self):                               # Used this to try and print a string to the instantiated Base Contract for the type of calc used instead of an address.
+        return self.model_name
+
+    def compute_price_single(self, **kwargs):
+        """compute_price for models that only have a batch implementation"""
+        arrays = [np.array([value], dtype=float) for value in (self.S, self.K, self.T, self.r, self.sigma)]
+        return float(self.price_batch(*arrays, np.array([self.type == "Call"]), None, q=np.array([self.q]), **kwargs)["price"][0])
+
 
 class BlackScholesPricing(PricingModel):
-    """Black Scholes pricing algorithm"""
+    """Black Scholes pricing algorithm - exact for European exercise and for American calls without dividends"""
+
+    model_name = "Black Scholes Pricing"
+    estimated_overhead = 3e-5
+    estimated_cost = 5e-8
+
     def __init__(self, contract):
         super().__init__(contract)
     
     def compute_price(self):
-        d1 = (np.log(self.S / self.K) + (self.r + 0.5 * self.sigma**2) * self.T) / (self.sigma * np.sqrt(self.T))
+        d1 = (np.log(self.S / self.K) + (self.r - self.q + 0.5 * self.sigma**2) * self.T) / (self.sigma * np.sqrt(self.T))
         d2 = d1 - self.sigma * np.sqrt(self.T)
         
         if self.type == "Call":
-            return self.S * norm.cdf(d1) - self.K * np.exp(-self.r * self.T) * norm.cdf(d2)
+            return self.S * np.exp(-self.q * self.T) * nd.cdf_scalar(d1) - self.K * np.exp(-self.r * self.T) * nd.cdf_scalar(d2)
         elif self.type == "Put":
-            return self.K * np.exp(-self.r * self.T) * norm.cdf(-d2) - self.S * norm.cdf(-d1)
+            return self.K * np.exp(-self.r * self.T) * nd.cdf_scalar(-d2) - self.S * np.exp(-self.q * self.T) * nd.cdf_scalar(-d1)
         else:
             return None
-        
-    def get_pricing_model_name(self):                                     # Used this to try and print a string to the instantiated Base Contract for the type of calc used instead of an address.
-        return "Black Scholes Pricing"
+
+    @staticmethod
+    def price_batch(S, K, T, r, sigma, is_call, backend, q=0.0):
+        return backend.black_scholes(S, K, T, r, sigma, is_call, greeks=True, q=q)
+
+
+class ScalarBlackScholesPricing(BlackScholesPricing):
+    """Same Black Scholes formulas one contract at a time with the math module - no array setup, so it beats the vectorized
+    backend on the few-contract batches of streaming ticks and loses on whole chains"""
+
+    estimated_overhead = 8e-6
+    estimated_cost = 1.7e-6
+    outputs = ["price", "delta", "gamma", "vega", "theta", "rho"]
+
+    @staticmethod
+    def price_batch(S, K, T, r, sigma, is_call, backend, q=0.0):
+        q = np.broadcast_to(q, np.shape(S))
+        rows = [ScalarBlackScholesPricing.price_and_greeks(*values) for values in
+                zip(*(np.asarray(values).tolist() for values in (S, K, T, r, sigma, q, is_call)))]
+        return {name: np.array(values, dtype=float) for name, values in zip(ScalarBlackScholesPricing.outputs, zip(*rows))}
+
+    @staticmethod
+    def price_and_greeks(S, K, T, r, sigma, q, is_call):
+        """Scaled like the backends - vega / rho per 1%, theta per day"""
+        sign = 1.0 if is_call else -1.0
+        sqrt_T = math.sqrt(T)
+        vol_sqrt_T = sigma * sqrt_T
+        d1 = (math.log(S / K) + (r - q + 0.5 * sigma**2) * T) / vol_sqrt_T
+        d2 = d1 - vol_sqrt_T
+        carry = math.exp(-q * T)
+        discounted_K = K * math.exp(-r * T)
+        cdf_d1, cdf_d2, pdf_d1 = nd.cdf_scalar(sign * d1), nd.cdf_scalar(sign * d2), nd.pdf_scalar(d1)
+
+        return (sign * (S * carry * cdf_d1 - discounted_K * cdf_d2),
+                sign * carry * cdf_d1,
+                carry * pdf_d1 / (S * vol_sqrt_T),
+                S * carry * pdf_d1 * sqrt_T / 100,
+                (-S * carry * pdf_d1 * sigma / (2 * sqrt_T) - sign * r * discounted_K * cdf_d2 + sign * q * S * carry * cdf_d1) / 365,
+                sign * T * discounted_K * cdf_d2 / 100)
+
+
+class BinomialPricing(PricingModel):
+    """Cox-Ross-Rubinstein lattice with early exercise - for American contracts where exercise before expiry can pay"""
+
+    model_name = "Binomial Pricing"
+    estimated_overhead = 1e-4
+    estimated_cost = 3e-4
+    uses_dividend_schedule = True                                   # Exercise values need the dividends still to be paid at each node
+    steps = 200
+
+    def __init__(self, contract):
+        super().__init__(contract)
+
+    def compute_price(self, steps=None, dividend_times=None, dividend_amounts=None):
+        """dividend_times / dividend_amounts: (1 x dividends) cash schedule, e.g. a row of DividendSchedule.times / amounts"""
+        return self.compute_price_single(steps=steps, dividend_times=dividend_times, dividend_amounts=dividend_amounts)
+
+    @staticmethod
+    def price_batch(S, K, T, r, sigma, is_call, backend, q=0.0, steps=None, dividend_times=None, dividend_amounts=None):
+        """Rolls every contract's tree back at once - one (contracts x nodes) array per time step.
+        S is the escrowed stock (net of the PV of the cash dividends before expiry) - the tree is built on it, and exercising
+        at a node is worth the escrowed price plus the PV of the dividends still to be paid before expiry"""
+        steps = steps or BinomialPricing.steps
+        q = np.broadcast_to(q, np.shape(S))
+        inputs = (S, K, T, r, sigma, is_call)
+        S, K, T, r, sigma, q = (values[:, None] for values in (S, K, T, r, sigma, q))
+        sign = np.where(is_call, 1.0, -1.0)[:, None]
+
+        dt = T / steps
+        u = np.exp(sigma * np.sqrt(dt))
+        disc = np.exp(-r * dt)
+        p = np.clip((np.exp((r - q) * dt) - 1 / u) / (u - 1 / u), 0, 1)  # Risk neutral up probability, drift net of the carry
+
+        stock_nodes = S * u ** np.arange(-steps, steps + 1)          # Every node price S * u^k once, each step slices its nodes out
+
+        def remaining_dividends(step):
+            if dividend_times is None:
+                return 0.0
+            t = step * dt
+            pending = (dividend_times > t) & (dividend_times < T)    # Paid after this node, before expiry
+            return (dividend_amounts * np.exp(-r * (np.where(pending, dividend_times, t) - t)) * pending).sum(axis=1, keepdims=True)
+
+        def exercise_value(step):
+            nodes = stock_nodes[:, steps - step:steps + step + 1:2][:, ::-1] + remaining_dividends(step)
+            return np.maximum(sign * (nodes - K), 0)
+
+        values = exercise_value(steps)
+        for step in range(steps - 1, -1, -1):
+            values = np.maximum(disc * (p * values[:, :-1] + (1 - p) * values[:, 1:]), exercise_value(step))
+            if step == 2:
+                two_steps = values
+            elif step == 1:
+                one_step = values
+
+        # Delta, gamma and theta from the first nodes of the tree
+        S_up, S_down = S * u, S / u
+        delta = (one_step[:, 0] - one_step[:, 1]) / (S_up - S_down)[:, 0]
+        gamma = (((two_steps[:, 0] - two_steps[:, 1]) / (S * u**2 - S)[:, 0] - (two_steps[:, 1] - two_steps[:, 2]) / (S - S / u**2)[:, 0])
+                 / (0.5 * (S * u**2 - S / u**2))[:, 0])
+        theta = (two_steps[:, 1] - values[:, 0]) / (2 * dt[:, 0]) / 365                # Scaled daily
+
+        result = {"price": values[:, 0], "delta": delta, "gamma": gamma, "theta": theta}
+        if backend is not None:                                     # Vega and rho would need two more trees - Black Scholes on the same inputs, as before routing
+            closed_form = backend.black_scholes(*inputs, greeks=True, q=q[:, 0])
+            result["vega"], result["rho"] = closed_form["vega"], closed_form["rho"]
+        return result
 
   
 class MonteCarloPricing(PricingModel):
-    """Monte Carlo pricing algorithm"""
+    """Monte Carlo pricing algorithm - full GBM paths with antithetic variates, for path dependent contracts"""
+
+    model_name = "Monte Carlo Pricing"
+    estimated_overhead = 5e-5
+    estimated_cost = 3e-5
+    uses_payoff = True
+    seed = 0                                                        # Fixed so repeated runs price the same contract the same way
+
     def __init__(self, contract):
         super().__init__(contract)
 
-    def compute_price(self, simulations=1000):                            # Placeholder for monte carlo - fully understand the sim before implementing
-        return 0    
-    
-    def get_pricing_model_name(self):
-        return "Monte Carlo Pricing"
+    def compute_price(self, payoff=None, simulations=1000):
+        return self.compute_price_single(payoff=payoff, simulations=simulations)
 
+    @staticmethod
+    def price_batch(S, K, T, r, sigma, is_call, backend, q=0.0, payoff=None, simulations=1000, steps=50):
+        """payoff(paths, K, is_call) returns the (contracts x simulations) payoffs of (contracts x simulations x steps) paths.
+        There is no default - a path dependent contract has to say what it pays, a vanilla price here would be silently wrong"""
+        if payoff is None:
+            raise NotImplementedError("Monte Carlo pricing needs the payoff of the path dependent contract - pass payoff=")
 
-# Expand for Binomial Pricing (future work).
+        rng = np.random.default_rng(MonteCarloPricing.seed)
+        z = rng.standard_normal((1, simulations // 2, steps))
+        z = np.concatenate([z, -z], axis=1)                         # Antithetic pairs halve the variance for free
+        q = np.broadcast_to(q, np.shape(S))
+        S, T, r, sigma, q = (values[:, None, None] for values in (S, T, r, sigma, q))
+
+        dt = T / steps
+        paths = S * np.exp(np.cumsum((r - q - 0.5 * sigma**2) * dt + sigma * np.sqrt(dt) * z, axis=2))
+        payoffs = payoff(paths, K[:, None], np.asarray(is_call)[:, None])
+        return {"price": np.exp(-r * T)[:, 0, 0] * payoffs.mean(axis=1)}
+
+    @staticmethod
+    def arithmetic_asian(paths, K, is_call):
+        """Average price option - pays max(average - K, 0) for calls, max(K - average, 0) for puts, averaged over the simulated dates"""
+        average = paths.mean(axis=2)
+        return np.maximum(np.where(is_call, average - K, K - average), 0)
 
-class PriceDifference:
-    
-    def __init__(self, contract):
-        self.contract = contract
-        self.price_difference = None
-        self.price_difference_percent = None
-
-    def compute_price_difference(self):
-        if self.contract.fair_value is not None and self.contract.ask is not None:
-            self.price_difference = self.contract.fair_value - self.contract.ask
-            
-    def compute_price_difference_percent(self):        
-        if self.contract.fair_value is not None and self.contract.ask is not None:
-            self.price_difference_percent = ((self.contract.fair_value / self.contract.ask) - 1) * 100
-        else:
-            self.price_difference_percent = 0   
 
 class Greeks:
 
     def __init__(self, contract):
         self.contract = contract                                    # Initializing to not have to keep writing "self.contract"
-        self.S = contract.S                                         # Code is more readable
+        self.S = contract.S - contract.dividend_pv                  # Same escrowed stock price as PricingModel
         self.K = contract.K
         self.T = contract.T
         self.r = contract.r
+        self.q = contract.q
+        self.carry = np.exp(-self.q * self.T)                       # e^(-qT), scales every stock-side term
         self.sigma = contract.sigma
         self.type = contract.type
         self.pricing_model_name = contract.pricing_model_name
         self.d1, self.d2 = self.calculate_d1_d2()
         
     def calculate_d1_d2(self):                                      # Eliminate the need to recalc d1 and d2
-        d1 = (np.log(self.S / self.K) + (self.r + 0.5 * self.sigma**2) * self.T) / (self.sigma * np.sqrt(self.T))
+        d1 = (np.log(self.S / self.K) + (self.r - self.q + 0.5 * self.sigma**2) * self.T) / (self.sigma * np.sqrt(self.T))
         d2 = d1 - self.sigma * np.sqrt(self.T)
         #print(f"Calculated d1: {d1}, d2: {d2}")                     # Debug
         return d1, d2
@@ -130,31 +376,31 @@ class Greeks:
 
     def calculate_delta(self):
         if self.type == "Call":
-            self.delta = norm.cdf(self.d1)
+            self.delta = self.carry * nd.cdf_scalar(self.d1)
         elif self.type == "Put":
-            self.delta = norm.cdf(self.d1) - 1
+            self.delta = self.carry * (nd.cdf_scalar(self.d1) - 1)
         return self.delta
 
     def calculate_gamma(self):
-        self.gamma = norm.pdf(self.d1) / (self.S * self.sigma * np.sqrt(self.T))
+        self.gamma = self.carry * nd.pdf_scalar(self.d1) / (self.S * self.sigma * np.sqrt(self.T))
         return self.gamma
 
     def calculate_vega(self):
-        self.vega = self.S * norm.pdf(self.d1) * np.sqrt(self.T) / 100          # Scaled for a 1% change
+        self.vega = self.S * self.carry * nd.pdf_scalar(self.d1) * np.sqrt(self.T) / 100          # Scaled for a 1% change
         return self.vega
     
     def calculate_theta(self):
         if self.type == "Call":
-            theta = (-self.S * norm.pdf(self.d1) * self.sigma) / (2 * np.sqrt(self.T)) - self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(self.d2)     
+            theta = (-self.S * self.carry * nd.pdf_scalar(self.d1) * self.sigma) / (2 * np.sqrt(self.T)) - self.r * self.K * np.exp(-self.r * self.T) * nd.cdf_scalar(self.d2) + self.q * self.S * self.carry * nd.cdf_scalar(self.d1)
         elif self.type == "Put":
-            theta = (-self.S * norm.pdf(self.d1) * self.sigma) / (2 * np.sqrt(self.T)) + self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(-self.d2)    
+            theta = (-self.S * self.carry * nd.pdf_scalar(self.d1) * self.sigma) / (2 * np.sqrt(self.T)) + self.r * self.K * np.exp(-self.r * self.T) * nd.cdf_scalar(-self.d2) - self.q * self.S * self.carry * nd.cdf_scalar(-self.d1)
         self.theta = theta / 365                                                                # Scaled daily
         return self.theta
 
     def calculate_rho(self):
         if self.type == "Call":
-            rho = self.K * self.T * np.exp(-self.r * self.T) * norm.cdf(self.d2)
+            rho = self.K * self.T * np.exp(-self.r * self.T) * nd.cdf_scalar(self.d2)
         elif self.type == "Put":
-            rho = -self.K * self.T * np.exp(-self.r * self.T) * norm.cdf(-self.d2)   
+            rho = -self.K * self.T * np.exp(-self.r * self.T) * nd.cdf_scalar(-self.d2)   
         self.rho = rho / 100                                                                    # Scaled 1% change
         return self.rho
\ No newline at end of file
@@ -0,0 +1,229 @@
+"""
+Filename: Streaming.py
+Author: Alex Kolodinsky
+Created: 2026-10-19
+Description:
+    Streaming mode - consume quote/underlying updates and keep the undervalued ranking up to date.
+"""
+
+import asyncio
+import bisect
+import time
+from abc import ABC, abstractmethod
+import pandas as pd
+import DataFactory as df
+import PricingModels as pf
+from ContractFilter import ContractFilter
+from Dividends import DividendSchedule
+
+
+class QuoteUpdate:
+    """ A single market update - either a new option quote or a new underlying price """
+    def __init__(self, kind, symbol, fields, timestamp=None):
+        self.kind = kind                                            # "quote" or "underlying"
+        self.symbol = symbol                                        # contractSymbol for quotes, Ticker for underlyings
+        self.fields = fields                                        # Only the values that changed
+        self.timestamp = timestamp
+
+
+class QuoteSource(ABC):
+    """ Pluggable source of market updates - a live feed only has to implement updates() """
+
+    @abstractmethod
+    def updates(self):
+        """ Async iterator of QuoteUpdate objects """
+        pass
+
+
+class ReplayFileSource(QuoteSource):
+    """ Local stand-in for a live feed. Replays a csv with columns: timestamp, kind, symbol, ask, impliedVolatility, price """
+
+    quote_fields = ["ask", "impliedVolatility"]                     # Columns that apply to "quote" rows (blank = unchanged)
+
+    def __init__(self, filename, speed=0):
+        self.filename = filename
+        self.speed = speed                                          # 0 = as fast as possible, 1 = real time, 2 = twice as fast ...
+
+    async def updates(self):
+        replay = pd.read_csv(self.filename)
+        replay["timestamp"] = pd.to_datetime(replay["timestamp"])
+        previous_time = None
+
+        for row in replay.to_dict("records"):
+            if self.speed > 0 and previous_time is not None:
+                await asyncio.sleep(max(0.0, (row["timestamp"] - previous_time).total_seconds() / self.speed))
+            else:
+                await asyncio.sleep(0)                              # Still hand control back to the subscribers between ticks
+            previous_time = row["timestamp"]
+
+            if row["kind"] == "underlying":
+                fields = {"price": row["price"]}
+            else:
+                fields = {key: row[key] for key in self.quote_fields if key in row and not pd.isna(row[key])}
+            yield QuoteUpdate(row["kind"], row["symbol"], fields, row["timestamp"])
+
+
+class UndervaluedBook:
+    """ Ordered list of undervalued contracts ranked by price difference percent - binary search finds a contract in O(log n), the
+    insert / delete is an O(n) list shift (one memmove, microseconds for a few thousand contracts) """
+
+    def __init__(self, top_n=25):
+        self.top_n = top_n
+        self.ranking = []                                           # Sorted (-price_difference_percent, name) keys
+        self.keys = {}                                              # name -> key currently in the ranking
+
+    def update(self, contract):
+        self.remove(contract.name)
+        if contract.price_difference is not None and contract.price_difference > 0:     # NaN compares False, so unpriced contracts drop out
+            key = (-contract.price_difference_percent, contract.name)
+            bisect.insort(self.ranking, key)
+            self.keys[contract.name] = key
+
+    def remove(self, name):
+        old_key = self.keys.pop(name, None)
+        if old_key is not None:
+            del self.ranking[bisect.bisect_left(self.ranking, old_key)]
+
+    def top(self):
+        return [name for _, name in self.ranking[:self.top_n]]
+
+
+class StreamingPricer:
+    """ Holds every priced contract, reprices only the ones an update touches and publishes top-N diffs to subscribers """
+
+    def __init__(self, contracts, top_n=25, pricing_factory=None, contract_filter=None, dividends=None):
+        self.contracts = {contract.name: contract for contract in contracts}
+        self.by_ticker = {}                                         # Ticker -> contract names, for underlying updates
+        for contract in contracts:
+            self.by_ticker.setdefault(df.ContractLoader.get_ticker(contract.name), []).append(contract.name)
+
+        self.pricing_factory = pricing_factory if pricing_factory is not None else pf.PricingModelFactory()
+        self.contract_filter = contract_filter if contract_filter is not None else ContractFilter()     # Same quote rules as ingestion
+        self.dividends = dividends                                  # Schedule the contracts were built with - the lattice reprices with its dates
+        self.book = UndervaluedBook(top_n)
+        for contract in contracts:
+            self.book.update(contract)
+
+        self.subscribers = []
+        self.tick = 0
+
+    @classmethod
+    def from_csv(cls, filename=None, top_n=25, rates=None, backend="numpy", contract_filter=None):
+        pricing_factory = pf.PricingModelFactory(backend)          # Same factory for the snapshot and the ticks - same backend, warm cost estimates
+        dividends = DividendSchedule.from_csv()
+        contracts = df.ContractLoader.build_contracts(filename, rates, backend, dividends=dividends, pricing_factory=pricing_factory)
+        return cls(contracts, top_n=top_n, pricing_factory=pricing_factory, contract_filter=contract_filter, dividends=dividends)
+
+    def subscribe(self):
+        """ Returns a queue that first receives the full top-N table, then one diff per tick that changed it. None ends the stream """
+        queue = asyncio.Queue()
+        ranking = self.book.top()
+        queue.put_nowait({
+            "tick": self.tick,
+            "added": [df.ContractLoader.to_record(self.contracts[name]) for name in ranking],
+            "removed": [],
+            "changed": [],
+            "ranking": ranking,
+            "latency": 0.0,
+        })
+        self.subscribers.append(queue)
+        return queue
+
+    def publish(self, diff):
+        for queue in self.subscribers:
+            queue.put_nowait(diff)
+
+    def affected_contracts(self, update):
+        """ Applies the update to the stored contracts and returns the ones that need repricing """
+        if update.kind == "underlying":
+            affected = [self.contracts[name] for name in self.by_ticker.get(update.symbol, [])]
+            for contract in affected:
+                contract.S = update.fields["price"]
+                contract.itm = contract.in_the_money()
+            return affected
+
+        contract = self.contracts.get(update.symbol)
+        if contract is None:                                        # Quote for a contract that was filtered out of the snapshot
+            return []
+        if "ask" in update.fields:
+            contract.ask = update.fields["ask"]
+        if "impliedVolatility" in update.fields:
+            contract.sigma = update.fields["impliedVolatility"]
+        return [contract]
+
+    def drop_invalid(self, contracts):
+        """ Takes contracts whose quote fails the filter out of the book instead of pricing them - they come back with the next good quote """
+        valid = self.contract_filter.valid_quotes([contract.ask for contract in contracts], [contract.sigma for contract in contracts],
+                                                  [contract.S for contract in contracts], [contract.K for contract in contracts],
+                                                  [contract.type == "Call" for contract in contracts])
+        for contract, ok in zip(contracts, valid):
+            if not ok:
+                self.book.remove(contract.name)
+        return [contract for contract, ok in zip(contracts, valid) if ok]
+
+    def apply_update(self, update):
+        """ Reprices the affected contracts and returns the top-N diff, or None if the table did not change """
+        start = time.perf_counter()
+        self.tick += 1
+        before = self.book.top()
+
+        affected = self.drop_invalid(self.affected_contracts(update))
+        df.ContractLoader.price_contracts(affected, self.pricing_factory, self.dividends)              # One batch per tick, e.g. every contract of a moved underlying
+        for contract in affected:
+            self.book.update(contract)
+
+        after = self.book.top()
+        before_set, after_set = set(before), set(after)
+        added = [name for name in after if name not in before_set]
+        removed = [name for name in before if name not in after_set]
+        changed = [contract.name for contract in affected if contract.name in after_set and contract.name in before_set]
+
+        if not added and not removed and not changed and before == after:
+            return None
+
+        return {
+            "tick": self.tick,
+            "added": [df.ContractLoader.to_record(self.contracts[name]) for name in added],
+            "removed": removed,
+            "changed": [df.ContractLoader.to_record(self.contracts[name]) for name in changed],
+            "ranking": after,                                       # New order of the names, so subscribers can re-sort without a full table
+            "latency": time.perf_counter() - start,
+        }
+
+    async def run(self, source):
+        async for update in source.updates():
+            diff = self.apply_update(update)
+            if diff is not None:
+                self.publish(diff)
+        self.publish(None)
+
+
+def apply_diff(table, diff):
+    """ Subscriber side (e.g. the dashboard) - applies a diff to a DataFrame in the to_record layout and returns it in ranked order """
+    records = diff["added"] + diff["changed"]
+    if records:
+        updates = pd.DataFrame(records).set_index("Name")
+        table = pd.concat([table.drop(index=updates.index, errors="ignore"), updates])
+    table = table.drop(index=diff["removed"], errors="ignore")
+    return table.reindex([name for name in diff["ranking"] if name in table.index])
+
+
+async def write_table(queue, filename="profitable_contracts_output.csv", interval=1.0):
+    """ Subscriber that keeps the dashboard's csv current - applies every diff and rewrites the file at most once per interval
+    (seconds) and once more when the stream ends. Dashboard.py reads the file on every rerun """
+    table = pd.DataFrame()
+    columns = None                                                  # to_record order, taken from the first rows received
+    last_write = None
+
+    def write():
+        if columns is not None:
+            table.rename_axis("Name").reset_index().reindex(columns=columns).to_csv(filename, index=False)
+
+    while (diff := await queue.get()) is not None:
+        if columns is None and diff["added"]:
+            columns = list(diff["added"][0])
+        table = apply_diff(table, diff)
+        if last_write is None or time.perf_counter() - last_write >= interval:
+            write()
+            last_write = time.perf_counter()
+    write()
@@ -10,14 +10,17 @@ Description:
 import ContractFactory as cf
 import DataFactory as df
 import PricingModels as pf
+import PricingBackends as pb
+import Streaming as sm
 import numpy as np
 import pandas as pd 
 import random
-import re
+import asyncio
+import argparse
 
-def main():
+def main(backend="numpy"):
     """Currently use trading edge as a proxy for profitability, however this should be changed to account for potential transaction costs or other factors """
-    profitable_contracts = df.ContractLoader.load_contract()
+    profitable_contracts = df.ContractLoader.load_contract(backend=backend)
 
     profitable_contracts.sort(key=lambda contract: contract.price_difference_percent, reverse=True)         # sort
 
@@ -27,33 +30,7 @@ def main():
     
     # Done for the dashboard. There should be a better way to call correctly from the data stored in the contract factory. (Research)
     if profitable_contracts:    
-        output_data = []
-        for contract in profitable_contracts:
-            company_name = re.match(r'^([A-Za-z]+)', contract.name)
-            company_ticker = company_name.group(1) if company_name else ""
-            contract_info = {
-                "Company": company_ticker,
-                "Name": contract.name,
-                "Type": contract.type,
-                "Price Difference Percent": round(contract.price_difference_percent, 2),
-                "Underlying_Price": contract.S,
-                "Strike": contract.K,
-                "In The Money": contract.itm,
-                "Algorithm Used": contract.pricing_model_name,
-                "Calculated_Price": round(contract.fair_value, 4),
-                "Ask": round(contract.ask, 4),
-                "Price Difference": round(contract.price_difference, 4),
-                "TTM": round(contract.T, 6),
-                "RFR": contract.r,
-                "Volatility": round(contract.sigma, 4),
-                "Delta": round(contract.delta, 4),
-                "Gamma": round(contract.gamma, 4),
-                "Vega": round(contract.vega, 4),
-                "Theta": round(contract.theta, 4),
-                "Rho": round(contract.rho, 4),
-
-            }
-            output_data.append(contract_info)
+        output_data = [df.ContractLoader.to_record(contract) for contract in profitable_contracts]
 
         df_output = pd.DataFrame(output_data)
         df_output.to_csv("profitable_contracts_output.csv", index=False)
@@ -71,5 +48,32 @@ def main():
     
 
 
+def main_stream(replay_file, top_n=25, speed=0, backend="numpy"):
+    """Streaming mode - prices the csv snapshot once, then reprices only the contracts touched by each replayed update.
+    The top-N table is kept in profitable_contracts_output.csv, so the dashboard shows the live ranking"""
+    pricer = sm.StreamingPricer.from_csv(top_n=top_n, backend=backend)
+    updates = pricer.subscribe()
+    dashboard = pricer.subscribe()
+
+    async def print_diffs():
+        while (diff := await updates.get()) is not None:
+            print(f"Tick {diff['tick']}: +{len(diff['added'])} -{len(diff['removed'])} ~{len(diff['changed'])} ({diff['latency'] * 1000:.3f} ms)")
+
+    async def run():
+        await asyncio.gather(pricer.run(sm.ReplayFileSource(replay_file, speed=speed)), print_diffs(), sm.write_table(dashboard))
+
+    asyncio.run(run())
+
+
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stream", metavar="REPLAY_FILE", help="Run in streaming mode using a replay file of quote updates")
+    parser.add_argument("--top", type=int, default=25, help="Number of undervalued contracts to keep ranked in streaming mode")
+    parser.add_argument("--speed", type=float, default=0, help="Replay speed multiplier, 0 replays as fast as possible")
+    parser.add_argument("--backend", default="numpy", choices=list(pb.backends), help="Compute backend for the batch pricer")
+    args = parser.parse_args()
+
+    if args.stream:
+        main_stream(args.stream, top_n=args.top, speed=args.speed, backend=args.backend)
+    else:
+        main(args.backend)
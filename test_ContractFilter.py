@@ -0,0 +1,72 @@
+"""
+Filename: test_ContractFilter.py
+Author: Alex Kolodinsky
+Created: 2026-10-19
+Description:
+    ContractFilter on a hand-built chain - kept rows and the per-rule removal report.
+    Run: python -m pytest test_ContractFilter.py
+"""
+
+import numpy as np
+import pandas as pd
+from ContractFilter import ContractFilter
+
+nan = float("nan")
+
+
+def chain():
+    rows = [
+        # Type,  S,   K,   bid,  ask,   volume, openInterest, ttm, impliedVolatility
+        ("Call", 100, 100, 4.9,  5.0,   10,     10,           0.5, 0.3),      # 0 kept
+        ("Call", 100, 100, 4.9,  nan,   10,     10,           0.5, 0.3),      # 1 missing ask - fails every later rule too, only charged once
+        ("Put",  100, 100, 0.0,  5.0,   10,     10,           0.5, 0.3),      # 2 zero bid
+        ("Put",  100, 100, 5.2,  5.0,   10,     10,           0.5, 0.3),      # 3 crossed
+        ("Call", 100, 100, 4.9,  5.0,   2,      2,            0.5, 0.3),      # 4 low volume and open interest - charged to volume only
+        ("Call", 100, 100, 4.9,  5.0,   10,     10,           0.0, 0.3),      # 5 expired
+        ("Call", 100, 100, 4.9,  5.0,   10,     10,           0.5, 10.0),     # 6 implied volatility too high
+        ("Call", 100, 100, 4.9,  5.0,   10,     10,           0.5, nan),      # 7 NaN implied volatility
+        ("Call", 100, 80,  14.0, 15.0,  10,     10,           0.5, 0.3),      # 8 ask below intrinsic (20)
+        ("Put",  100, 100, 99.0, 100.0, 10,     10,           0.5, 0.3),      # 9 ask at the upper bound (K)
+        ("Put",  100, 95,  2.9,  3.0,   10,     10,           0.5, 0.3),      # 10 kept
+    ]
+    columns = ["Type", "Underlying_Price", "strike", "bid", "ask", "volume", "openInterest", "ttm", "impliedVolatility"]
+    return pd.DataFrame(rows, columns=columns)
+
+
+def test_apply_keeps_rows_and_reports_each_removal_once():
+    contract_filter = ContractFilter()
+    kept = contract_filter.apply(chain())
+
+    assert list(kept.index) == [0, 10]
+    assert contract_filter.report == {
+        "missing data": 1,
+        "zero / crossed quote": 2,
+        "volume": 1,
+        "open interest": 0,
+        "time to maturity": 1,
+        "implied volatility": 2,
+        "ask below intrinsic": 1,
+        "ask above upper bound": 1,
+    }
+    assert sum(contract_filter.report.values()) == len(chain()) - len(kept)
+
+
+def test_optional_rules():
+    contract_filter = ContractFilter(min_volume=None, max_relative_spread=0.025)
+    kept = contract_filter.apply(chain())
+
+    assert list(kept.index) == [0]
+    assert "volume" not in contract_filter.report
+    assert contract_filter.report["open interest"] == 1                     # Row 4 now falls to the next liquidity rule
+    assert contract_filter.report["spread"] == 2                            # Rows 8 (1 / 14.5) and 10 (0.1 / 2.95)
+    assert contract_filter.report["ask below intrinsic"] == 0               # Row 8 was already removed by the spread rule
+
+
+def test_valid_quotes():
+    #                                      good  zero  NaN   high IV  below intrinsic  at upper bound
+    valid = ContractFilter().valid_quotes([5.0, 0.0, nan, 5.0, 15.0, 100.0],
+                                          [0.3, 0.3, 0.3, 10.0, 0.3, 0.3],
+                                          [100, 100, 100, 100, 100, 100],
+                                          [100, 100, 100, 100, 80, 100],
+                                          [True, True, True, True, True, False])
+    assert list(valid) == [True, False, False, False, False, False]
@@ -0,0 +1,66 @@
+"""
+Filename: test_Dividends.py
+Author: Alex Kolodinsky
+Created: 2026-10-19
+Description:
+    DividendSchedule broadcasting (present value, carry, lookup) and lattice pricing with discrete cash dividends.
+    Run: python -m pytest test_Dividends.py
+"""
+
+import math
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import pytest
+import PricingModels as pf
+import PricingBackends as pb
+from Dividends import DividendSchedule
+
+today = datetime(2026, 1, 1)
+
+
+def schedule():
+    cash = pd.DataFrame({"Ticker": ["AAPL", "AAPL", "MSFT", "XOM"],
+                         "exDate": ["2026-03-02", "2026-05-31", "2026-02-01", "2025-12-01"],     # XOM went ex before today
+                         "amount": [0.25, 0.26, 0.8, 1.0]})
+    return DividendSchedule(cash, yields={"SPY": 0.013}, borrow={"MSFT": 0.02, "GME": 0.3}, today=today)
+
+
+def test_present_value():
+    dividends = schedule()
+    tickers = ["AAPL", "AAPL", "MSFT", "XOM", "TSLA"]
+    T = [0.5, 0.2, 0.5, 0.5, 0.5]
+    r = [0.04] * 5
+    aapl = [60 / 365, 150 / 365]
+
+    expected = [0.25 * math.exp(-0.04 * aapl[0]) + 0.26 * math.exp(-0.04 * aapl[1]),
+                0.25 * math.exp(-0.04 * aapl[0]),                          # Second dividend is after expiry
+                0.8 * math.exp(-0.04 * 31 / 365),
+                0.0,
+                0.0]
+    np.testing.assert_allclose(dividends.present_value(tickers, T, r), expected, rtol=1e-12)
+
+
+def test_carry_and_lookup():
+    dividends = schedule()
+    np.testing.assert_allclose(dividends.carry(["SPY", "MSFT", "GME", "AAPL", "TSLA"]), [0.013, 0.02, 0.3, 0.0, 0.0])
+
+    rows = dividends.lookup(["AAPL", "TSLA"])
+    assert rows[1] == len(dividends.tickers)                               # Unknown tickers get the row that never pays
+    assert np.isinf(dividends.times[rows[1]]).all() and not dividends.amounts[rows[1]].any()
+    np.testing.assert_allclose(dividends.amounts[rows[0], :2], [0.25, 0.26])
+
+
+def test_lattice_adds_back_remaining_dividends():
+    # S=100, K=100, T=0.5, r=4%, sigma=25%, $3 dividend at 0.2y
+    factory = pf.PricingModelFactory()
+    pv = 3 * math.exp(-0.04 * 0.2)
+    result = factory.price_batch([100, 100], [100, 100], [0.5, 0.5], [0.04, 0.04], [0.25, 0.25], [True, False],
+                                 dividend_pv=[pv, pv], dividend_times=[[0.2], [0.2]], dividend_amounts=[[3.0], [3.0]])
+    european = pb.get_backend("numpy").black_scholes(np.full(2, 100 - pv), np.full(2, 100.0), np.full(2, 0.5), np.full(2, 0.04),
+                                                     np.full(2, 0.25), np.array([True, False]))
+
+    assert list(result["pricing_model_name"]) == ["Binomial Pricing"] * 2
+    assert result["price"][0] == pytest.approx(6.4925, abs=1e-3)            # Quadrature reference (exercise just before the ex-date) 6.4945
+    assert result["price"][1] == pytest.approx(7.609, abs=1e-3)
+    assert result["price"][0] > european["price"][0] + 0.1                  # Escrowed European call is 6.382
@@ -0,0 +1,35 @@
+"""
+Filename: test_PricingBackends.py
+Author: Alex Kolodinsky
+Created: 2026-10-19
+Description:
+    Parity of every compute backend against the float64 reference classes, at the tolerances documented in PricingBackends.py.
+    Run: python -m pytest test_PricingBackends.py
+"""
+
+import pytest
+import PricingBackends as pb
+
+greek_names = ["delta", "gamma", "vega", "theta", "rho"]
+
+
+def parity(name):
+    try:
+        return pb.check_parity(name)
+    except ImportError as e:                                        # numexpr / numba are optional
+        pytest.skip(str(e))
+
+
+@pytest.mark.parametrize("name", ["numpy", "numexpr", "numba"])
+def test_float64_backends_match_reference(name):
+    errors = parity(name)
+    assert errors["price"] < 1e-12
+    for greek in greek_names:
+        assert errors[greek] < 1e-12, greek
+
+
+def test_float32_backend_within_screening_tolerance():
+    errors = parity("float32")
+    assert errors["price / S"] < 1e-6
+    for greek in greek_names:
+        assert errors[greek] < 1e-5, greek
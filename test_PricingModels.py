@@ -0,0 +1,95 @@
+"""
+Filename: test_PricingModels.py
+Author: Alex Kolodinsky
+Created: 2026-10-19
+Description:
+    Lattice prices and Greeks, routing masks and engine choice of PricingModelFactory.
+    Run: python -m pytest test_PricingModels.py
+"""
+
+import numpy as np
+import pytest
+import PricingModels as pf
+import PricingBackends as pb
+
+backend = pb.get_backend("numpy")
+
+
+def arrays(*values):
+    return [np.array(value, dtype=float) for value in values]
+
+
+def test_american_put_lattice():
+    S, K, T, r, sigma = arrays([100], [100], [1], [0.05], [0.2])
+    lattice = pf.BinomialPricing.price_batch(S, K, T, r, sigma, np.array([False]), backend)
+    european = backend.black_scholes(S, K, T, r, sigma, np.array([False]), greeks=True)
+
+    assert lattice["price"][0] == pytest.approx(6.09, abs=0.01)
+    assert lattice["price"][0] > european["price"][0] + 0.5                # Early exercise premium
+    assert -0.5 < lattice["delta"][0] < european["delta"][0] + 0.05
+    assert lattice["gamma"][0] > 0
+    assert lattice["theta"][0] < 0
+    assert lattice["vega"][0] == european["vega"][0]                       # Taken from the closed form
+
+
+def test_american_call_without_dividends_matches_black_scholes():
+    S, K, T, r, sigma = arrays([100, 100, 80], [90, 110, 100], [0.5, 1, 0.25], [0.05, 0.03, 0.01], [0.3, 0.2, 0.5])
+    is_call = np.ones(3, dtype=bool)
+    lattice = pf.BinomialPricing.price_batch(S, K, T, r, sigma, is_call, backend)
+    closed_form = backend.black_scholes(S, K, T, r, sigma, is_call, greeks=True)
+
+    np.testing.assert_allclose(lattice["price"], closed_form["price"], atol=0.02)
+    np.testing.assert_allclose(lattice["delta"], closed_form["delta"], atol=0.005)
+    np.testing.assert_allclose(lattice["gamma"], closed_form["gamma"], atol=0.001)
+
+    result = pf.PricingModelFactory().price_batch(S, K, T, r, sigma, is_call)
+    assert list(result["pricing_model_name"]) == ["Black Scholes Pricing"] * 3
+    np.testing.assert_allclose(result["price"], closed_form["price"], atol=1e-12)
+
+
+def test_routing_groups():
+    #                    European ATM put, American ATM put, American call, American call + dividends, deep OTM put, expiring put, path dependent
+    S, K, T = arrays([100] * 7, [100, 100, 100, 100, 70, 100, 100], [0.5, 0.5, 0.5, 0.5, 0.5, 1 / 365, 0.5])
+    is_call = np.array([False, False, True, True, False, False, True])
+    american = np.array([False, True, True, True, True, True, True])
+    path_dependent = np.array([False] * 6 + [True])
+    pays_dividends = np.array([False, False, False, True, False, False, False])
+
+    groups = {name: list(np.flatnonzero(mask)) for name, mask, _, _ in
+              pf.RoutingPolicy().groups(S, K, T, is_call, american, path_dependent, pays_dividends)}
+    assert groups == {"closed form": [0, 2, 4, 5], "early exercise": [1, 3], "path dependent": [6]}
+
+
+def test_european_contracts_never_go_to_the_lattice():
+    factory = pf.PricingModelFactory()
+    factory.costs["lattice"] = {"overhead": 0.0, "per_contract": 0.0}
+    result = factory.price_batch([100], [100], [0.5], [0.05], [0.2], [False], american=[False])
+    assert result["pricing_model_name"][0] == "Black Scholes Pricing"
+
+
+def test_closed_form_engine_choice():
+    factory = pf.PricingModelFactory()
+    assert factory.choose_engine(["bs", "bs_scalar"], None, 1) == "bs_scalar"
+    assert factory.choose_engine(["bs", "bs_scalar"], None, 10_000) == "bs"
+
+    rng = np.random.default_rng(0)
+    S, K, T, r, sigma, q = (rng.uniform(low, high, 50) for low, high in
+                            [(50, 150), (50, 150), (0.01, 1), (0, 0.05), (0.1, 0.8), (0, 0.03)])
+    is_call = rng.random(50) < 0.5
+    scalar = pf.ScalarBlackScholesPricing.price_batch(S, K, T, r, sigma, is_call, backend, q=q)
+    vectorized = pf.BlackScholesPricing.price_batch(S, K, T, r, sigma, is_call, backend, q=q)
+    for name in scalar:
+        np.testing.assert_allclose(scalar[name], vectorized[name], atol=1e-12)
+
+
+def test_path_dependent_contracts_use_their_payoff():
+    asian = pf.MonteCarloPricing.arithmetic_asian
+    result = pf.PricingModelFactory().price_batch([100] * 2, [100] * 2, [0.5] * 2, [0.05] * 2, [0.3] * 2, [True] * 2, payoffs=[asian, None])
+
+    assert list(result["pricing_model_name"]) == ["Monte Carlo Pricing", "Black Scholes Pricing"]
+    assert 0 < result["price"][0] < result["price"][1]                     # Averaging lowers the volatility of the payoff
+
+
+def test_monte_carlo_without_payoff_raises():
+    with pytest.raises(NotImplementedError):
+        pf.MonteCarloPricing.price_batch(*arrays([100], [100], [0.5], [0.05], [0.3]), np.array([True]), backend)
@@ -0,0 +1,89 @@
+"""
+Filename: test_Streaming.py
+Author: Alex Kolodinsky
+Created: 2026-10-19
+Description:
+    StreamingPricer on a tiny in-memory replay - top-N diffs, bad quotes leaving the book and rejoining, apply_diff on the subscriber side.
+    Run: python -m pytest test_Streaming.py
+"""
+
+import asyncio
+import pandas as pd
+import ContractFactory as cf
+import DataFactory as df
+import PricingModels as pf
+import Streaming as sm
+
+# Black Scholes values 9.10 / 6.34 / 4.23 - all three start undervalued, K105 and K95 lead
+K95, K100, K105 = "AAPL260320C00095000", "AAPL260320C00100000", "AAPL260320C00105000"
+
+
+class ListSource(sm.QuoteSource):
+    def __init__(self, updates):
+        self.updates_list = updates
+
+    async def updates(self):
+        for update in self.updates_list:
+            await asyncio.sleep(0)
+            yield update
+
+
+def pricer():
+    contracts = [cf.CallOption(name, 100.0, strike, False, 0.25, 0.03, 0.3, "Call", ask)
+                 for name, strike, ask in [(K95, 95.0, 7.0), (K100, 100.0, 5.5), (K105, 105.0, 3.0)]]
+    factory = pf.PricingModelFactory()
+    df.ContractLoader.price_contracts(contracts, factory)
+    return sm.StreamingPricer(contracts, top_n=2, pricing_factory=factory)
+
+
+def quote(symbol, ask):
+    return sm.QuoteUpdate("quote", symbol, {"ask": ask})
+
+
+def names(records):
+    return [record["Name"] for record in records]
+
+
+def test_replay_diffs():
+    streaming = pricer()
+    queue = streaming.subscribe()
+    source = ListSource([
+        quote(K100, 3.0),                                           # Jumps to the top, pushes K95 out
+        quote(K100, 0.0),                                           # Bad quote - leaves the book instead of ranking at infinity
+        quote(K100, 2.5),                                           # Rejoins with the next valid quote
+        quote(K105, 2.9),                                           # Stays second, row changes
+        quote("MSFT260320C00100000", 1.0),                          # Unknown contract - no diff
+        quote(K95, 9.0),                                            # Outside the top-N either way - no diff
+    ])
+    asyncio.run(streaming.run(source))
+
+    diffs = []
+    while (diff := queue.get_nowait()) is not None:
+        diffs.append(diff)
+
+    snapshot, *ticks = diffs
+    assert snapshot["ranking"] == [K105, K95] and names(snapshot["added"]) == [K105, K95]
+    assert [(names(diff["added"]), diff["removed"], names(diff["changed"]), diff["ranking"]) for diff in ticks] == [
+        ([K100], [K95], [], [K100, K105]),
+        ([K95], [K100], [], [K105, K95]),
+        ([K100], [K95], [], [K100, K105]),
+        ([], [], [K105], [K100, K105]),
+    ]
+    assert [diff["tick"] for diff in ticks] == [1, 2, 3, 4]
+
+    table = pd.DataFrame()
+    for diff in diffs:
+        table = sm.apply_diff(table, diff)
+    assert list(table.index) == streaming.book.top()
+    assert table.loc[K105, "Ask"] == 2.9
+
+
+def test_book_remove():
+    book = sm.UndervaluedBook(top_n=2)
+    streaming = pricer()
+    for contract in streaming.contracts.values():
+        book.update(contract)
+
+    book.remove(K105)
+    book.remove("not in the book")
+    assert book.top() == [K95, K100]